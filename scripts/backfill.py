@@ -2,34 +2,41 @@
 NBA Backfill Scraper
 ====================
 Scrapes all games for a range of dates.
-Usage: python scripts/backfill.py 2025-10-22 2026-02-13
+Usage: python scripts/backfill.py 2025-10-22 2026-02-13 [--rebuild-index]
 """
 
 import sys
-import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import chain, islice
 
 from scrape import (
-    get_games, get_players, get_recap, condense,
-    load_player_log, save_player_log, update_player_log, generate_blurbs,
-    DATA_DIR, log, DELAY,
+    get_games, fetch_game_details, condense,
+    load_player_log, save_player_log, process_players,
+    load_index, save_index, dump_json, DATA_DIR, log,
 )
-import json
 
+DAY_WORKERS = 4  # dates fetched concurrently; scrape.py caps requests per host and per second
 
-def scrape_date(date_str: str, plog: dict) -> dict:
-    """Scrape all games for a single date."""
+
+def fetch_date(date_str: str) -> tuple[list[dict], list[tuple[dict, str]]]:
+    """Fetch the scoreboard plus per-game players and recaps for a date."""
     games = get_games(date_str)
-    results = []
+    return games, fetch_game_details(games)
 
-    for g in games:
-        gid = g["espn_id"]
-        time.sleep(DELAY)
 
-        players_data = get_players(gid)
-        time.sleep(DELAY)
+def scrape_date(date_str: str, plog: dict, fetched=None) -> dict:
+    """Scrape all games for a single date.
+
+    `fetched` is an optional (games, details) result of fetch_date, so the
+    network work can happen ahead of time on another thread.
+    """
+    games, details = fetched if fetched is not None else fetch_date(date_str)
+    results = []
 
-        recap_text = get_recap(gid)
+    for g, (players_data, recap_text) in zip(games, details):
+        gid = g["espn_id"]
         summary = condense(recap_text) if recap_text else ""
 
         if not summary:
@@ -46,9 +53,9 @@ def scrape_date(date_str: str, plog: dict) -> dict:
                 else:
                     summary = f"{winner} def. {loser}, {hi}-{lo}."
 
-        all_game_players = players_data.get("home", []) + players_data.get("away", [])
-        update_player_log(plog, all_game_players, date_str)
-        blurbs = generate_blurbs(plog, all_game_players, date_str)
+        blurbs = process_players(
+            plog, chain(players_data.get("home", []), players_data.get("away", [])), date_str
+        )
 
         results.append({
             "game_id": gid,
@@ -73,56 +80,67 @@ def scrape_date(date_str: str, plog: dict) -> dict:
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python scripts/backfill.py START_DATE END_DATE")
+    args = sys.argv[1:]
+    rebuild_index = "--rebuild-index" in args
+    args = [a for a in args if a != "--rebuild-index"]
+    if len(args) < 2:
+        print("Usage: python scripts/backfill.py START_DATE END_DATE [--rebuild-index]")
         print("       python scripts/backfill.py 2025-10-22 2026-02-13")
         sys.exit(1)
 
-    start = datetime.strptime(sys.argv[1], "%Y-%m-%d")
-    end = datetime.strptime(sys.argv[2], "%Y-%m-%d")
+    start = datetime.strptime(args[0], "%Y-%m-%d")
+    end = datetime.strptime(args[1], "%Y-%m-%d")
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     plog = load_player_log()
-    current = start
+    index = load_index(rebuild=rebuild_index)
     total_days = (end - start).days + 1
-    day_num = 0
-
-    while current <= end:
-        day_num += 1
-        date_str = current.strftime("%Y-%m-%d")
-        out_file = DATA_DIR / f"{date_str}.json"
 
-        if out_file.exists():
+    pending = []
+    for day_num in range(1, total_days + 1):
+        date_str = (start + timedelta(days=day_num - 1)).strftime("%Y-%m-%d")
+        if (DATA_DIR / f"{date_str}.json").exists():
             log.info(f"[{day_num}/{total_days}] {date_str} — already exists, skipping.")
-            current += timedelta(days=1)
-            continue
-
-        log.info(f"[{day_num}/{total_days}] Scraping {date_str}...")
-
-        try:
-            data = scrape_date(date_str, plog)
-            with open(out_file, "w") as f:
-                json.dump(data, f, indent=2)
-            log.info(f"  Wrote {len(data['games'])} game(s).")
-        except Exception as e:
-            log.error(f"  Failed: {e}")
-
-        time.sleep(1)
-        current += timedelta(days=1)
+            index.add(date_str)
+        else:
+            pending.append((day_num, date_str))
+
+    # Fetch days concurrently, but apply them to the player log strictly in
+    # date order so starts/minutes history matches a serial run. Only
+    # DAY_WORKERS dates are submitted ahead, so if the loop is interrupted
+    # the executor isn't left to fetch the rest of the range on exit.
+    upcoming = iter(pending)
+    in_flight = deque()
+    with ThreadPoolExecutor(max_workers=DAY_WORKERS) as ex:
+        def submit_next(n):
+            for day_num, date_str in islice(upcoming, n):
+                in_flight.append((day_num, date_str, ex.submit(fetch_date, date_str)))
+
+        submit_next(DAY_WORKERS)
+        while in_flight:
+            day_num, date_str, future = in_flight.popleft()
+            submit_next(1)
+            log.info(f"[{day_num}/{total_days}] Scraping {date_str}...")
+
+            try:
+                data = scrape_date(date_str, plog, future.result())
+                dump_json(DATA_DIR / f"{date_str}.json", data)
+                index.add(date_str)
+                log.info(f"  Wrote {len(data['games'])} game(s).")
+            except Exception as e:
+                log.error(f"  Failed: {e}")
+                continue
+
+            # Keep the log in step with the day files: a rerun skips any
+            # date that has a file, so its updates must already be saved.
+            save_player_log(plog)
 
-    # Save player log
-    save_player_log(plog)
     log.info(f"Player log: {len(plog)} players tracked.")
 
     # Update index
-    dates = sorted(
-        [p.stem for p in DATA_DIR.glob("*.json") if p.stem not in ("index", "player_log")],
-        reverse=True,
-    )
-    with open(DATA_DIR / "index.json", "w") as f:
-        json.dump({"dates": dates}, f, indent=2)
-    log.info(f"Done. Index: {len(dates)} date(s).")
+    save_index(index)
+    log.info(f"Done. Index: {len(index)} date(s).")
 
 
 if __name__ == "__main__":
@@ -8,22 +8,47 @@ Also maintains a season-long player log (player_log.json) to detect:
   - Notable DNPs for regular starters
 """
 
+import hashlib
+import heapq
+import importlib.util
 import json
 import logging
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from itertools import chain
 from pathlib import Path
+from typing import Iterable
+from urllib.parse import urlencode, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# lxml is only used as BeautifulSoup's tree builder, so just probe for it
+BS4_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
 # ---------------------------------------------------------------------------
 ET = timezone(timedelta(hours=-5))
 DOCS = Path(__file__).resolve().parent.parent / "docs"
 DATA_DIR = DOCS / "data"
 PLAYER_LOG = DATA_DIR / "player_log.json"
+INDEX_FILE = DATA_DIR / "index.json"
+CACHE_DIR = DATA_DIR / ".cache"   # raw ESPN game responses + validators
 
 ESPN_SCOREBOARD = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
 ESPN_SUMMARY = "https://site.web.api.espn.com/apis/site/v2/sports/basketball/nba/summary"
@@ -38,39 +63,224 @@ HEADERS = {
     ),
 }
 
-DELAY = 0.5
+MAX_WORKERS = 8      # games fetched concurrently; also the in-flight cap per host
+RATE_LIMIT = 15.0    # politeness: sustained ESPN requests/second, all threads combined
+BLOWOUT_MARGIN = 25  # at this final margin the recap isn't fetched at all
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
 log = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# JSON helpers — orjson when available, stdlib json otherwise
+# ---------------------------------------------------------------------------
+def write_atomic(path: Path, body: bytes):
+    """Write via a temp file and rename, so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(body)
+    tmp.replace(path)
+
+
+def dump_json(path: Path, obj, pretty: bool = False):
+    """Write obj as UTF-8 JSON — compact unless pretty (2-space indent)."""
+    if orjson is not None:
+        body = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    elif pretty:
+        body = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    else:
+        body = json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    write_atomic(path, body)
+
+
+def parse_json(body: bytes | str):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def load_json(path: Path):
+    return parse_json(path.read_bytes())
+
+
 # ---------------------------------------------------------------------------
 # HTTP helpers
 # ---------------------------------------------------------------------------
-def fetch_json(url, params=None, retries=3):
-    for i in range(retries):
-        try:
-            r = requests.get(url, headers=HEADERS, params=params, timeout=20)
-            r.raise_for_status()
-            return r.json()
-        except Exception as e:
-            log.warning(f"  Attempt {i+1}: {e}")
-            if i < retries - 1:
-                time.sleep(2 ** i)
-    return None
-
-
-def fetch_html(url, retries=3):
-    for i in range(retries):
-        try:
-            r = requests.get(url, headers=HEADERS, timeout=20)
-            r.raise_for_status()
-            return r.text
-        except Exception as e:
-            log.warning(f"  Attempt {i+1}: {e}")
-            if i < retries - 1:
-                time.sleep(2 ** i)
-    return None
+# One keep-alive session for every ESPN call, sized for MAX_WORKERS threads.
+# Retries (connection errors, 429 and 5xx) happen inside the adapter, with
+# exponential backoff and Retry-After honoured.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_RETRY))
+
+# Caps in-flight requests per host, across every thread (games and backfill
+# days); pool_maxsize above leaves room for all of them.
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+# Token bucket shared by every host: up to MAX_WORKERS requests may start at
+# once, after which starts are paced to RATE_LIMIT per second.
+_bucket_lock = threading.Lock()
+_bucket_tokens = float(MAX_WORKERS)
+_bucket_at = time.monotonic()
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(MAX_WORKERS)
+        return _host_slots[host]
+
+
+def _throttle():
+    """Block until the token bucket lets this thread start a request."""
+    global _bucket_tokens, _bucket_at
+    with _bucket_lock:
+        now = time.monotonic()
+        _bucket_tokens = min(MAX_WORKERS, _bucket_tokens + (now - _bucket_at) * RATE_LIMIT)
+        _bucket_at = now
+        # Take the token now, even if it goes negative: later callers then
+        # queue up behind this one instead of racing for the same refill.
+        _bucket_tokens -= 1
+        wait = -_bucket_tokens / RATE_LIMIT
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _cache_path(url, params, suffix) -> Path:
+    key = url + "?" + urlencode(sorted((params or {}).items()))
+    return CACHE_DIR / (hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + suffix)
+
+
+def _read_meta(path: Path) -> dict:
+    meta_file = path.with_suffix(".meta.json")
+    return load_json(meta_file) if meta_file.exists() else {}
+
+
+def _write_meta(path: Path, meta: dict):
+    meta_file = path.with_suffix(".meta.json")
+    if meta:
+        dump_json(meta_file, meta)
+    else:
+        meta_file.unlink(missing_ok=True)
+
+
+def _write_cache(path: Path, body: bytes, headers=None, final: bool = False):
+    """Store a response body, plus its ETag/Last-Modified validators if any.
+    `final` marks a body fetched once the resource could no longer change."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, body)
+
+    meta = {k: headers[k] for k in ("ETag", "Last-Modified") if headers and k in headers}
+    if final:
+        meta["final"] = True
+    _write_meta(path, meta)
+
+
+def _seal_cache(path: Path):
+    """Mark an existing cache entry as final, so it is no longer revalidated."""
+    meta = _read_meta(path)
+    meta["final"] = True
+    _write_meta(path, meta)
+
+
+def _is_sealed(path: Path) -> bool:
+    """True only for entries written (or confirmed by a 304) while final —
+    a body cached before a game finished must still be revalidated."""
+    return path.exists() and _read_meta(path).get("final", False)
+
+
+def _conditional_headers(path: Path) -> dict:
+    """If-None-Match / If-Modified-Since for a cached body, so an unchanged
+    resource comes back as a bodyless 304."""
+    if not path.exists():
+        return {}
+    meta = _read_meta(path)
+    headers = {}
+    if "ETag" in meta:
+        headers["If-None-Match"] = meta["ETag"]
+    if "Last-Modified" in meta:
+        headers["If-Modified-Since"] = meta["Last-Modified"]
+    return headers
+
+
+def fetch_json(url, params=None, cache=False, immutable=False):
+    """GET a JSON endpoint; None if the request ultimately fails.
+
+    With cache=True the raw body is kept in CACHE_DIR. immutable=True says the
+    resource can no longer change: an entry cached under that promise is
+    served straight from disk, and a freshly fetched body is stored as such.
+    Anything else is revalidated with a conditional GET and reused on 304.
+    """
+    cache_file = _cache_path(url, params, ".json") if cache else None
+    if cache_file and immutable and _is_sealed(cache_file):
+        return load_json(cache_file)
+    headers = _conditional_headers(cache_file) if cache_file else {}
+
+    try:
+        with _host_slot(url):
+            _throttle()
+            r = _SESSION.get(url, params=params, headers=headers, timeout=20)
+    except requests.RequestException as e:
+        log.warning(f"  Giving up on {url}: {e}")
+        return None
+
+    # Status checks rather than raise_for_status(): a failed fetch is routine
+    # here and doesn't need an exception built and unwound.
+    if r.status_code == 304:
+        if immutable:
+            _seal_cache(cache_file)
+        return load_json(cache_file)
+    if not 200 <= r.status_code < 300:
+        log.warning(f"  Giving up on {url}: HTTP {r.status_code}")
+        return None
+    try:
+        data = parse_json(r.content)
+    except ValueError:
+        log.warning(f"  Giving up on {url}: response is not JSON")
+        return None
+
+    if cache_file:
+        _write_cache(cache_file, r.content, r.headers, final=immutable)
+    return data
+
+
+def fetch_html(url, cache=False, immutable=False):
+    """GET a page's text; None if the request ultimately fails.
+
+    Caches like fetch_json, except that nothing is marked final here: a 200
+    page may not have its content yet, so the caller seals the entry
+    (_seal_cache) once it has what it needs from it.
+    """
+    cache_file = _cache_path(url, None, ".html") if cache else None
+    if cache_file and immutable and _is_sealed(cache_file):
+        return cache_file.read_text(encoding="utf-8")
+    headers = _conditional_headers(cache_file) if cache_file else {}
+
+    try:
+        with _host_slot(url):
+            _throttle()
+            r = _SESSION.get(url, headers=headers, timeout=20)
+    except requests.RequestException as e:
+        log.warning(f"  Giving up on {url}: {e}")
+        return None
+
+    if r.status_code == 304:
+        return cache_file.read_text(encoding="utf-8")
+    if not 200 <= r.status_code < 300:
+        log.warning(f"  Giving up on {url}: HTTP {r.status_code}")
+        return None
+
+    if cache_file:
+        _write_cache(cache_file, r.text.encode("utf-8"), r.headers)
+    return r.text
 
 
 # ---------------------------------------------------------------------------
@@ -85,19 +295,27 @@ def get_games(date_str: str) -> list[dict]:
 
     games = []
     for event in data.get("events", []):
-        competition = event.get("competitions", [{}])[0]
+        try:
+            competition = event["competitions"][0]
+        except (KeyError, IndexError):
+            continue
         competitors = competition.get("competitors", [])
-        home = next((c for c in competitors if c.get("homeAway") == "home"), {})
-        away = next((c for c in competitors if c.get("homeAway") == "away"), {})
+        home = away = {}
+        for c in competitors:
+            side = c.get("homeAway")
+            if side == "home" and not home:
+                home = c
+            elif side == "away" and not away:
+                away = c
 
         games.append({
             "espn_id": event.get("id", ""),
-            "status": event.get("status", {}).get("type", {}).get("description", ""),
-            "home_team": home.get("team", {}).get("displayName", ""),
-            "home_tricode": home.get("team", {}).get("abbreviation", ""),
+            "status": _dig(event, "status", "type", "description"),
+            "home_team": _dig(home, "team", "displayName"),
+            "home_tricode": _dig(home, "team", "abbreviation"),
             "home_score": _int(home.get("score", 0)),
-            "away_team": away.get("team", {}).get("displayName", ""),
-            "away_tricode": away.get("team", {}).get("abbreviation", ""),
+            "away_team": _dig(away, "team", "displayName"),
+            "away_tricode": _dig(away, "team", "abbreviation"),
             "away_score": _int(away.get("score", 0)),
         })
 
@@ -108,24 +326,23 @@ def get_games(date_str: str) -> list[dict]:
 # ---------------------------------------------------------------------------
 # 2. Get ALL players from ESPN summary API
 # ---------------------------------------------------------------------------
-def get_players(game_id: str) -> dict:
-    """Fetch all players (starters + bench) from ESPN game summary API."""
+def get_players(game_id: str, final: bool = False) -> dict:
+    """Fetch all players (starters + bench) from ESPN game summary API.
+    A final game's cached summary is reused without asking ESPN."""
     log.info(f"  Fetching summary API for {game_id}...")
-    data = fetch_json(ESPN_SUMMARY, params={"event": game_id})
+    data = fetch_json(ESPN_SUMMARY, params={"event": game_id}, cache=True, immutable=final)
     if not data:
         return {"home": [], "away": []}
 
     result = {"home": [], "away": []}
     boxscore = data.get("boxscore", {})
-    team_order = []  # track order: first team listed = away
 
-    for player_group in boxscore.get("players", []):
+    for team_idx, player_group in enumerate(boxscore.get("players", [])):
         team_info = player_group.get("team", {})
         tricode = team_info.get("abbreviation", "")
         home_away = team_info.get("homeAway", "")
-        team_order.append(home_away or ("away" if len(team_order) == 0 else "home"))
-
-        key = home_away if home_away in ("home", "away") else team_order[-1]
+        # Without an explicit homeAway, the first team listed is away
+        key = home_away if home_away in ("home", "away") else ("away" if team_idx == 0 else "home")
 
         for stat_group in player_group.get("statistics", []):
             athletes = stat_group.get("athletes", [])
@@ -135,10 +352,7 @@ def get_players(game_id: str) -> dict:
                 player = athlete.get("athlete", {})
                 stats_raw = athlete.get("stats", [])
 
-                stat_map = {}
-                for j, label in enumerate(labels):
-                    if j < len(stats_raw):
-                        stat_map[label] = stats_raw[j]
+                stat_map = dict(zip(labels, stats_raw))
 
                 # Parse minutes: ESPN format is "32:15" or "DNP" or "--"
                 min_str = stat_map.get("MIN", "0")
@@ -146,6 +360,10 @@ def get_players(game_id: str) -> dict:
 
                 did_not_play = min_str in ("DNP", "--", "") or minutes == 0
 
+                # Field goals come as "FGM-FGA" unless split into their own columns
+                fg = stat_map.get("FG", "")
+                fg_parts = fg.split("-") if "-" in fg else ("0", "0")
+
                 entry = {
                     "name": player.get("displayName", ""),
                     "id": player.get("id", ""),
@@ -159,8 +377,8 @@ def get_players(game_id: str) -> dict:
                     "stl": _int(stat_map.get("STL", "0")),
                     "blk": _int(stat_map.get("BLK", "0")),
                     "to": _int(stat_map.get("TO", "0")),
-                    "fgm": _int(stat_map.get("FGM", stat_map.get("FG", "0").split("-")[0] if "-" in stat_map.get("FG", "") else "0")),
-                    "fga": _int(stat_map.get("FGA", stat_map.get("FG", "0").split("-")[1] if "-" in stat_map.get("FG", "") else "0")),
+                    "fgm": _int(stat_map.get("FGM", fg_parts[0])),
+                    "fga": _int(stat_map.get("FGA", fg_parts[1])),
                     "team": tricode,
                 }
 
@@ -172,36 +390,143 @@ def get_players(game_id: str) -> dict:
 # ---------------------------------------------------------------------------
 # 3. Get written recap
 # ---------------------------------------------------------------------------
-def get_recap(game_id: str) -> str:
+_WS_RE = re.compile(r'\s+')
+
+# Recap containers, tried in order: a <div> whose class contains one of the
+# substrings (case-insensitive); the first group matches ESPN's story body.
+_RECAP_CLASS_GROUPS = (
+    ("story__body", "article-body", "gamerecap"),
+    ("story",),
+)
+# Every node any recap lookup could use, so the DOM is only walked once.
+_RECAP_CANDIDATES = ", ".join(
+    [f'div[class*="{k}" i]' for group in _RECAP_CLASS_GROUPS for k in group] + ["article"]
+)
+
+
+def _first_container(candidates: list[tuple], group: tuple):
+    """Node of the first (tag, class, node) candidate that is a matching <div>."""
+    return next((n for tag, cls, n in candidates if tag == "div" and any(k in cls for k in group)), None)
+
+
+def get_recap(game_id: str, final: bool = False) -> str:
     log.info(f"  Fetching recap for {game_id}...")
     for url in [ESPN_RECAP.format(game_id=game_id), ESPN_RECAP_ALT.format(game_id=game_id)]:
-        html = fetch_html(url)
+        html = fetch_html(url, cache=True, immutable=final)
         if not html:
             continue
 
-        soup = BeautifulSoup(html, "html.parser")
-        for selector in [
-            {"class_": re.compile(r"Story__Body|article-body|gameRecap", re.I)},
-            {"class_": re.compile(r"story", re.I)},
-        ]:
-            container = soup.find("div", **selector)
-            if container:
-                paragraphs = container.find_all("p")
-                if paragraphs:
-                    text = " ".join(p.get_text(separator=" ", strip=True) for p in paragraphs)
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    if len(text) > 50:
-                        return text
-
-        article = soup.find("article")
-        if article:
-            text = article.get_text(separator=" ", strip=True)
-            if len(text) > 50:
-                return text
+        text = _recap_text_jsonld(html)
+        if not text:
+            text = _recap_text_lexbor(html) if LexborHTMLParser is not None else _recap_text_bs4(html)
+        if text:
+            # Only a page that actually had the story is worth keeping for good
+            if final:
+                _seal_cache(_cache_path(url, None, ".html"))
+            return text
 
     return ""
 
 
+def _recap_text_jsonld(html: str) -> str:
+    """Cheapest path: the story's articleBody from its JSON-LD <script>,
+    found with a plain string scan — no DOM is built."""
+    pos = 0
+    while (idx := html.find("application/ld+json", pos)) != -1:
+        start = html.find(">", idx) + 1
+        end = html.find("</script>", start)
+        if start == 0 or end == -1:
+            break
+        pos = end
+        try:
+            blob = parse_json(html[start:end])
+        except ValueError:
+            continue
+
+        nodes = blob if isinstance(blob, list) else [blob]
+        for node in nodes:
+            if isinstance(node, dict) and isinstance(node.get("@graph"), list):
+                nodes.extend(node["@graph"])
+        for node in nodes:
+            body = node.get("articleBody") if isinstance(node, dict) else None
+            if isinstance(body, str):
+                text = _WS_RE.sub(' ', body).strip()
+                if len(text) > 50:
+                    return text
+
+    return ""
+
+
+def _recap_text_lexbor(html: str) -> str:
+    """Fast path: selectolax's C parser with native CSS class matching."""
+    tree = LexborHTMLParser(html)
+    candidates = [(n.tag, (n.attributes.get("class") or "").lower(), n) for n in tree.css(_RECAP_CANDIDATES)]
+    for group in _RECAP_CLASS_GROUPS:
+        container = _first_container(candidates, group)
+        if container:
+            paragraphs = container.css("p")
+            if paragraphs:
+                text = " ".join(p.text(separator=" ", strip=True) for p in paragraphs)
+                text = _WS_RE.sub(' ', text).strip()
+                if len(text) > 50:
+                    return text
+
+    article = next((n for tag, _, n in candidates if tag == "article"), None)
+    if article:
+        text = article.text(separator=" ", strip=True)
+        if len(text) > 50:
+            return text
+
+    return ""
+
+
+def _recap_text_bs4(html: str) -> str:
+    soup = BeautifulSoup(html, BS4_PARSER)
+    candidates = [(n.name, " ".join(n.get("class", [])).lower(), n) for n in soup.select(_RECAP_CANDIDATES)]
+    for group in _RECAP_CLASS_GROUPS:
+        container = _first_container(candidates, group)
+        if container:
+            paragraphs = container.find_all("p")
+            if paragraphs:
+                text = " ".join(p.get_text(separator=" ", strip=True) for p in paragraphs)
+                text = _WS_RE.sub(' ', text).strip()
+                if len(text) > 50:
+                    return text
+
+    article = next((n for tag, _, n in candidates if tag == "article"), None)
+    if article:
+        text = article.get_text(separator=" ", strip=True)
+        if len(text) > 50:
+            return text
+
+    return ""
+
+
+def fetch_game_details(games: list[dict]) -> list[tuple[dict, str]]:
+    """Fetch players and recap for each game concurrently.
+
+    Returns one (players_data, recap_text) pair per game, in the same order
+    as `games`, so callers can apply player log updates sequentially.
+    Responses go through the on-disk cache: entries stored once a game was
+    final are read straight from it, anything else is revalidated with a
+    conditional GET.
+    Blowouts skip the recap; the score-based summary covers them.
+    """
+    def fetch(g):
+        gid = g["espn_id"]
+        final = g["status"] == "Final"
+        players_data = get_players(gid, final=final)
+
+        hs, as_ = g["home_score"], g["away_score"]
+        if hs and as_ and abs(hs - as_) >= BLOWOUT_MARGIN:
+            log.info(f"  Skipping recap for {gid} ({hs}-{as_} blowout).")
+            return players_data, ""
+        return players_data, get_recap(gid, final=final)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        return list(ex.map(fetch, games))
+
+
 # ---------------------------------------------------------------------------
 # 4. Player log — track season-long per-player data
 # ---------------------------------------------------------------------------
@@ -211,25 +536,27 @@ def load_player_log() -> dict:
                       "starts": int, "total_min": float, "dates_started": [...] } }
     """
     if PLAYER_LOG.exists():
-        with open(PLAYER_LOG) as f:
-            return json.load(f)
+        return load_json(PLAYER_LOG)
     return {}
 
 
 def save_player_log(plog: dict):
-    with open(PLAYER_LOG, "w") as f:
-        json.dump(plog, f, indent=2)
+    dump_json(PLAYER_LOG, plog)
 
 
-def update_player_log(plog: dict, players: list[dict], date_str: str):
-    """Update the player log with today's game data."""
+def process_players(plog: dict, players: Iterable[dict], date_str: str) -> list[str]:
+    """Update the player log with today's game data and return noteworthy
+    blurbs, judged against each player's history before this game."""
+    blurbs = []
+
     for p in players:
         pid = p.get("id", "")
         if not pid or p.get("dnp"):
             continue
 
-        if pid not in plog:
-            plog[pid] = {
+        entry = plog.get(pid)
+        if entry is None:
+            entry = plog[pid] = {
                 "name": p["name"],
                 "team": p.get("team", ""),
                 "games": 0,
@@ -238,31 +565,20 @@ def update_player_log(plog: dict, players: list[dict], date_str: str):
                 "dates_started": [],
             }
 
-        entry = plog[pid]
+        games_before = entry["games"]
+        min_before = entry["total_min"]
+        minutes = p.get("min", 0)
+
         entry["name"] = p["name"]
         entry["team"] = p.get("team", entry["team"])
         entry["games"] += 1
-        entry["total_min"] += p.get("min", 0)
+        entry["total_min"] += minutes
 
         if p.get("starter"):
             entry["starts"] += 1
             entry["dates_started"].append(date_str)
 
-
-def generate_blurbs(plog: dict, all_players: list[dict], date_str: str) -> list[str]:
-    """Generate noteworthy blurbs based on player log context."""
-    blurbs = []
-
-    for p in all_players:
-        pid = p.get("id", "")
-        if not pid or p.get("dnp"):
-            continue
-
-        entry = plog.get(pid, {})
-        games_before = entry.get("games", 1) - 1  # subtract current game
-        avg_min = entry.get("total_min", 0) / max(entry.get("games", 1), 1)
-        starts = entry.get("starts", 0)
-        minutes = p.get("min", 0)
+        starts = entry["starts"]
         name = p["name"]
         team = p.get("team", "")
 
@@ -275,7 +591,7 @@ def generate_blurbs(plog: dict, all_players: list[dict], date_str: str) -> list[
 
         # Played way more than usual (50%+ more than average, min 10 min increase)
         elif games_before >= 10 and minutes > 0:
-            prev_avg = (entry.get("total_min", 0) - minutes) / max(games_before, 1)
+            prev_avg = min_before / games_before
             if prev_avg > 0 and minutes >= prev_avg * 1.5 and (minutes - prev_avg) >= 10:
                 blurbs.append(
                     f"⬆️ {name} ({team}) played {minutes:.0f} min (season avg: {prev_avg:.0f}). "
@@ -285,43 +601,64 @@ def generate_blurbs(plog: dict, all_players: list[dict], date_str: str) -> list[
     return blurbs
 
 
+# ---------------------------------------------------------------------------
+# 5. Date index — the list of scraped dates the site reads
+# ---------------------------------------------------------------------------
+def load_index(rebuild: bool = False) -> set[str]:
+    """Dates listed in index.json. Rescans DATA_DIR when asked to, or when
+    the index doesn't exist yet."""
+    if rebuild or not INDEX_FILE.exists():
+        return {p.stem for p in DATA_DIR.glob("*.json") if p.stem not in ("index", "player_log")}
+    return set(load_json(INDEX_FILE).get("dates", []))
+
+
+def save_index(dates: set[str]):
+    dump_json(INDEX_FILE, {"dates": sorted(dates, reverse=True)}, pretty=True)
+
+
 # ---------------------------------------------------------------------------
 # Summary condensation
 # ---------------------------------------------------------------------------
+_DATELINE_RE = re.compile(r'^[A-Z\s\.]+--\s*[-—–]?\s*')
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+_KEYWORDS = (
+    'triple-double', 'double-double', 'career-high', 'season-high',
+    'scored', 'led', 'points', 'clutch', 'overtime', 'debut',
+    'injury', 'returned', 'traded', 'record', 'streak', 'historic',
+    'milestone', 'ejected', 'first time', 'consecutive',
+)
+_KW_RE = re.compile('|'.join(map(re.escape, _KEYWORDS)), re.I)
+
+
+def _sentence_score(item: tuple[int, str]) -> int:
+    i, s = item
+    # Each distinct keyword counts once, however often it appears
+    score = 2 * len({kw.lower() for kw in _KW_RE.findall(s)})
+    if i == 0:
+        score += 4
+    return score
+
+
 def condense(text: str) -> str:
     if not text or len(text) < 30:
         return text
 
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
 
     # Strip city/dateline prefix like "OKLAHOMA CITY -- —" or "LOS ANGELES -- —"
-    text = re.sub(r'^[A-Z\s\.]+--\s*[-—–]?\s*', '', text).strip()
+    text = _DATELINE_RE.sub('', text).strip()
 
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENT_RE.split(text)
     if not sentences:
         return text[:250]
 
-    keywords = [
-        'triple-double', 'double-double', 'career-high', 'season-high',
-        'scored', 'led', 'points', 'clutch', 'overtime', 'debut',
-        'injury', 'returned', 'traded', 'record', 'streak', 'historic',
-        'milestone', 'ejected', 'first time', 'consecutive',
-    ]
-
-    scored = []
-    for i, s in enumerate(sentences):
-        lower = s.lower()
-        score = sum(2 for kw in keywords if kw in lower)
-        if i == 0:
-            score += 4
-        scored.append((score, i, s))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-    top = scored[:2]
-    top.sort(key=lambda x: x[1])
+    # Top 2 sentences by score (ties go to the earlier one), in original order
+    top = heapq.nlargest(2, enumerate(sentences), key=_sentence_score)
+    top.sort(key=lambda x: x[0])
 
     # Join and ensure we don't cut mid-sentence
-    summary = ' '.join(s for _, _, s in top)
+    summary = ' '.join(s for _, s in top)
     if len(summary) > 400:
         # Cut at the last sentence boundary within 400 chars
         truncated = summary[:400]
@@ -333,6 +670,15 @@ def condense(text: str) -> str:
     return summary
 
 
+def _dig(d, *keys, default=""):
+    """Walk nested dicts by key, returning `default` if any level is missing."""
+    for k in keys:
+        if not isinstance(d, dict):
+            return default
+        d = d.get(k)
+    return default if d is None else d
+
+
 def _int(val):
     try:
         return int(val)
@@ -341,22 +687,24 @@ def _int(val):
 
 
 def _parse_minutes(val: str) -> float:
-    """Parse ESPN minutes format like '32:15' or '32' into float minutes."""
-    if not val or val in ("DNP", "--", ""):
-        return 0
-    try:
-        if ":" in val:
-            parts = val.split(":")
-            return int(parts[0]) + int(parts[1]) / 60
-        return float(val)
-    except (ValueError, TypeError):
+    """Parse ESPN minutes format like '32:15' or '32' into float minutes.
+    Anything else ('DNP', '--', junk) is 0, checked up front rather than by
+    catching ValueError on every bad value."""
+    if not val or val[0] in "D-":
         return 0
+    m, sep, s = val.partition(":")
+    if sep:
+        return int(m) + int(s) / 60 if m.isdecimal() and s.isdecimal() else 0
+    return float(m) if m.replace(".", "", 1).isdecimal() else 0
+
+
+_ORD_SUFFIX = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")
 
 
 def _ordinal(n: int) -> str:
-    if 11 <= n <= 13:
+    if 11 <= n % 100 <= 13:
         return f"{n}th"
-    return f"{n}{['th','st','nd','rd'][n%10] if n%10 < 4 else 'th'}"
+    return f"{n}{_ORD_SUFFIX[n % 10]}"
 
 
 # ---------------------------------------------------------------------------
@@ -365,7 +713,10 @@ def _ordinal(n: int) -> str:
 def main():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    target = sys.argv[1] if len(sys.argv) > 1 else None
+    args = sys.argv[1:]
+    rebuild_index = "--rebuild-index" in args
+    args = [a for a in args if a != "--rebuild-index"]
+    target = args[0] if args else None
     date_label = target or datetime.now(ET).strftime("%Y-%m-%d")
 
     log.info(f"=== NBA Daily Scraper (ESPN) — {date_label} ===")
@@ -376,18 +727,13 @@ def main():
     # 1. Get games
     games = get_games(date_label)
 
-    # 2. Enrich each game
+    # 2. Fetch all players (summary API) and written recaps concurrently
+    details = fetch_game_details(games)
+
+    # 3. Enrich each game
     results = []
-    for g in games:
+    for g, (players_data, recap_text) in zip(games, details):
         gid = g["espn_id"]
-        time.sleep(DELAY)
-
-        # All players from summary API
-        players_data = get_players(gid)
-        time.sleep(DELAY)
-
-        # Written recap
-        recap_text = get_recap(gid)
         summary = condense(recap_text) if recap_text else ""
 
         # Fallback summary
@@ -405,12 +751,10 @@ def main():
                 else:
                     summary = f"{winner} def. {loser}, {hi}-{lo}."
 
-        # Update player log with all players who played
-        all_game_players = players_data.get("home", []) + players_data.get("away", [])
-        update_player_log(plog, all_game_players, date_label)
-
-        # Generate blurbs about unusual performances
-        blurbs = generate_blurbs(plog, all_game_players, date_label)
+        # Update player log with all players who played, noting unusual performances
+        blurbs = process_players(
+            plog, chain(players_data.get("home", []), players_data.get("away", [])), date_label
+        )
 
         results.append({
             "game_id": gid,
@@ -434,8 +778,7 @@ def main():
     # Write game data
     out = {"date": date_label, "games": results}
     out_file = DATA_DIR / f"{date_label}.json"
-    with open(out_file, "w") as f:
-        json.dump(out, f, indent=2)
+    dump_json(out_file, out)
     log.info(f"Wrote {len(results)} game(s) to {out_file}")
 
     # Save player log
@@ -443,12 +786,9 @@ def main():
     log.info(f"Player log: {len(plog)} players tracked.")
 
     # Update index
-    dates = sorted(
-        [p.stem for p in DATA_DIR.glob("*.json") if p.stem != "index" and p.stem != "player_log"],
-        reverse=True,
-    )
-    with open(DATA_DIR / "index.json", "w") as f:
-        json.dump({"dates": dates}, f, indent=2)
+    dates = load_index(rebuild=rebuild_index)
+    dates.add(date_label)
+    save_index(dates)
     log.info(f"Index: {len(dates)} date(s).")
 
 